@@ -270,7 +270,7 @@ def show_raw_config() -> None:
         
         # Convert config to dict and display as YAML
         import yaml
-        config_dict = config.dict()
+        config_dict = config.model_dump()
         
         # Remove sensitive data
         if 'ai' in config_dict:
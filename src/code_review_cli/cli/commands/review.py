@@ -7,7 +7,6 @@ import logging
 from pathlib import Path
 from typing import List, Optional
 import uuid
-from datetime import datetime
 
 import typer
 from rich.console import Console
@@ -15,6 +14,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ...core.git.differ import GitDiffer
 from ...core.git.parser import DiffParser
+from ...core.git.files import matches_patterns
 from ...core.ai import OllamaClient, OpenAIClient, AnthropicClient, GeminiClient, MistralClient
 from ...core.ai.prompts import PromptEngine
 from ...core.config.manager import ConfigManager
@@ -141,11 +141,8 @@ async def _run_review_async(
                     continue
                 
                 # Check git config exclude patterns
-                git_exclude_patterns = config.git.exclude_patterns
-                if git_exclude_patterns:
-                    import fnmatch
-                    if any(fnmatch.fnmatch(file.path, pattern) for pattern in git_exclude_patterns):
-                        continue
+                if matches_patterns(file.path, config.git.exclude_patterns):
+                    continue
                     
                 filtered_files.append(file)
             
@@ -218,8 +215,8 @@ async def _run_review_async(
                 # Parse the AI response into issues
                 issues = _parse_ai_response(ai_response.content, diff)
                 
-                # Create review result
-                result = ReviewResult(
+                # Create review result; every value here is already validated
+                result = ReviewResult.from_trusted(
                     id=str(uuid.uuid4()),
                     status=ReviewStatus.COMPLETED,
                     request=request,
@@ -236,7 +233,6 @@ async def _run_review_async(
                         lines_added=sum(f.stats.additions for f in diff.files) if diff else 0,
                         lines_deleted=sum(f.stats.deletions for f in diff.files) if diff else 0,
                     ),
-                    created_at=datetime.utcnow(),
                     ai_provider_used=config.ai.provider,
                     ai_model_used=config.ai.model,
                 )
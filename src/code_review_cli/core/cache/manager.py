@@ -58,7 +58,7 @@ class CacheManager:
         
         if cached_data:
             try:
-                return GitDiff(**cached_data)
+                return GitDiff.model_validate(cached_data)
             except Exception as e:
                 logger.warning(f"Failed to deserialize cached git diff: {e}")
                 return None
@@ -85,7 +85,7 @@ class CacheManager:
         """
         self.storage.set(
             "git_diff",
-            git_diff.dict(),
+            git_diff.model_dump(mode="json"),
             metadata={
                 "source_branch": source_branch,
                 "target_branch": target_branch,
@@ -181,7 +181,7 @@ class CacheManager:
         
         if cached_data:
             try:
-                return ReviewResult(**cached_data)
+                return ReviewResult.model_validate(cached_data)
             except Exception as e:
                 logger.warning(f"Failed to deserialize cached review result: {e}")
                 return None
@@ -202,7 +202,7 @@ class CacheManager:
         """
         self.storage.set(
             "review_result",
-            review_result.dict(),
+            review_result.model_dump(mode="json"),
             ttl_seconds=ttl_days * 24 * 3600,
             metadata={
                 "review_id": review_result.id,
@@ -14,6 +14,11 @@ from ...models.config import CacheConfig
 
 logger = logging.getLogger(__name__)
 
+# Serializers for non-JSON-native values, keyed by exact type
+_SERIALIZERS = {
+    datetime: datetime.isoformat,
+}
+
 
 class CacheStorage:
     """SQLite-based cache storage for AI responses and git operations."""
@@ -395,11 +400,16 @@ class CacheStorage:
     
     def _json_serializer(self, obj: Any) -> Any:
         """Custom JSON serializer for datetime and other objects."""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif hasattr(obj, 'dict'):
-            return obj.dict()
-        elif hasattr(obj, '__dict__'):
-            return obj.__dict__
-        else:
-            return str(obj) 
\ No newline at end of file
+        serializer = _SERIALIZERS.get(type(obj))
+        if serializer is not None:
+            return serializer(obj)
+        
+        to_dict = getattr(obj, 'dict', None)
+        if to_dict is not None:
+            return to_dict()
+        
+        attributes = getattr(obj, '__dict__', None)
+        if attributes is not None:
+            return attributes
+        
+        return str(obj) 
\ No newline at end of file
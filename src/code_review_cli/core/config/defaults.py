@@ -24,9 +24,8 @@ def get_minimal_config() -> Config:
         Minimal configuration object
     """
     return Config(
-        output={"default_format": "json", "color_enabled": False, "show_progress": False},
+        output={"format": "json", "color_enabled": False, "show_progress": False},
         cache={"enabled": False},
-        debug=False,
     )
 
 
@@ -38,10 +37,8 @@ def get_development_config() -> Config:
         Development configuration object
     """
     return Config(
-        debug=True,
-        log_level="DEBUG",
-        output={"verbose": True, "show_progress": True},
-        cache={"enabled": True, "git_diff_ttl": 60, "ai_response_ttl": 300},  # Short TTL for dev
+        output={"show_progress": True},
+        cache={"enabled": True, "ttl_hours": 1},  # Short TTL for dev
         history={"enabled": False, "max_entries": 100, "retention_days": 7},  # Disabled by default, shorter retention for dev
         ai=AIConfig(
             provider="openai",  # Default to OpenAI
@@ -197,7 +197,7 @@ class ConfigManager:
     
     def _config_to_dict(self, config: Config) -> Dict[str, Any]:
         """Convert Config object to dictionary for YAML serialization."""
-        config_dict = config.dict(exclude_none=True)
+        config_dict = config.model_dump(exclude_none=True)
         
         # Remove sensitive data from saved config
         if 'ai' in config_dict and 'api_key' in config_dict['ai']:
@@ -229,7 +229,7 @@ class ConfigManager:
             Updated configuration
         """
         current_config = self.get_config()
-        current_dict = current_config.dict()
+        current_dict = current_config.model_dump()
         
         # Deep merge the updates
         updated_dict = self._deep_merge(current_dict, kwargs)
@@ -253,7 +253,7 @@ class ConfigManager:
             Updated configuration
         """
         current_config = self.get_config()
-        current_dict = current_config.dict()
+        current_dict = current_config.model_dump()
         
         # Navigate to the target location
         keys = key_path.split('.')
@@ -286,7 +286,7 @@ class ConfigManager:
             Configuration value
         """
         config = self.get_config()
-        config_dict = config.dict()
+        config_dict = config.model_dump()
         
         # Navigate to the target value
         keys = key_path.split('.')
@@ -10,6 +10,7 @@ from git import Repo, InvalidGitRepositoryError, GitCommandError
 
 from ...models.diff import GitDiff, DiffFile, ChangeType
 from .parser import DiffParser
+from .files import matches_patterns
 
 
 logger = logging.getLogger(__name__)
@@ -218,20 +219,13 @@ class GitDiffer:
         exclude_patterns: Optional[List[str]],
     ) -> bool:
         """Check if a file should be included based on patterns."""
-        import fnmatch
-        
         # Check exclude patterns first
-        if exclude_patterns:
-            for pattern in exclude_patterns:
-                if fnmatch.fnmatch(file_path, pattern):
-                    return False
+        if matches_patterns(file_path, exclude_patterns):
+            return False
         
         # Check include patterns
         if include_patterns:
-            for pattern in include_patterns:
-                if fnmatch.fnmatch(file_path, pattern):
-                    return True
-            return False  # No include pattern matched
+            return matches_patterns(file_path, include_patterns)
         
         return True  # No patterns specified, include by default
     
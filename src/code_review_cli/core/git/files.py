@@ -1,14 +1,45 @@
 """File handling utilities for git operations."""
 
+import fnmatch
+import functools
 import logging
 import mimetypes
+import os
+import re
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Pattern, Sequence, Tuple
 
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Pattern[str]:
+    """Compile glob patterns into a single regex matching any of them."""
+    return re.compile("|".join(
+        fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns
+    ))
+
+
+def matches_patterns(file_path: str, patterns: Optional[Sequence[str]]) -> bool:
+    """
+    Check whether a path matches any of the given glob patterns.
+    
+    Equivalent to fnmatch.fnmatch against each pattern, but matches once
+    against a combined, cached regex.
+    
+    Args:
+        file_path: Path to check
+        patterns: Glob patterns
+        
+    Returns:
+        True if any pattern matches
+    """
+    if not patterns:
+        return False
+    return _compile_patterns(tuple(patterns)).match(os.path.normcase(file_path)) is not None
+
+
 class FileHandler:
     """Handles file operations and language detection."""
     
@@ -221,21 +252,13 @@ class FileHandler:
             logger.debug(f"Skipping {file_path}: too large ({file_size} bytes)")
             return False
         
-        # Apply pattern filtering
-        import fnmatch
-        
         # Check exclude patterns first
-        if exclude_patterns:
-            for pattern in exclude_patterns:
-                if fnmatch.fnmatch(file_path, pattern):
-                    return False
+        if matches_patterns(file_path, exclude_patterns):
+            return False
         
         # Check include patterns
         if include_patterns:
-            for pattern in include_patterns:
-                if fnmatch.fnmatch(file_path, pattern):
-                    return True
-            return False  # No include pattern matched
+            return matches_patterns(file_path, include_patterns)
         
         return True  # No patterns specified, include by default
     
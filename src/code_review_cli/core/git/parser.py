@@ -110,13 +110,13 @@ class DiffParser:
         lines = diff_content.split('\n')
         
         current_hunk = None
-        line_idx = 0
+        hunk_lines = None
+        old_line_num = 0
+        new_line_num = 0
         
-        while line_idx < len(lines):
-            line = lines[line_idx]
-            
-            # Check for hunk header
-            hunk_match = self.hunk_header_pattern.match(line)
+        for line in lines:
+            # Check for hunk header; only lines starting with "@@" can match
+            hunk_match = line.startswith('@@') and self.hunk_header_pattern.match(line)
             if hunk_match:
                 # Save previous hunk if exists
                 if current_hunk:
@@ -137,17 +137,34 @@ class DiffParser:
                     section_header=section_header,
                     lines=[],
                 )
+                hunk_lines = current_hunk.lines
                 
-                line_idx += 1
+                # Line numbers advance as lines are read, instead of
+                # recounting the hunk for every line
+                old_line_num = old_start
+                new_line_num = new_start
                 continue
             
             # Process hunk content lines
             if current_hunk and line:
-                diff_line = self._parse_diff_line(line, current_hunk)
-                if diff_line:
-                    current_hunk.lines.append(diff_line)
-            
-            line_idx += 1
+                line_type = line[0]
+                old_line = None
+                new_line = None
+                
+                if line_type in (' ', '-'):  # Context or deletion
+                    old_line = old_line_num
+                    old_line_num += 1
+                
+                if line_type in (' ', '+'):  # Context or addition
+                    new_line = new_line_num
+                    new_line_num += 1
+                
+                hunk_lines.append(DiffLine(
+                    old_line_number=old_line,
+                    new_line_number=new_line,
+                    content=line[1:],
+                    line_type=line_type,
+                ))
         
         # Add the last hunk
         if current_hunk:
@@ -155,58 +172,6 @@ class DiffParser:
         
         return hunks
     
-    def _parse_diff_line(self, line: str, hunk: DiffHunk) -> Optional[DiffLine]:
-        """
-        Parse a single diff line.
-        
-        Args:
-            line: Raw diff line
-            hunk: Current hunk context
-            
-        Returns:
-            DiffLine object or None
-        """
-        if not line:
-            return None
-        
-        line_type = line[0] if line else ' '
-        content = line[1:] if len(line) > 1 else ''
-        
-        # Calculate line numbers based on hunk context and previous lines
-        old_line_num = None
-        new_line_num = None
-        
-        if line_type in [' ', '-']:  # Context or deletion
-            old_line_num = self._calculate_old_line_number(hunk)
-        
-        if line_type in [' ', '+']:  # Context or addition
-            new_line_num = self._calculate_new_line_number(hunk)
-        
-        return DiffLine(
-            old_line_number=old_line_num,
-            new_line_number=new_line_num,
-            content=content,
-            line_type=line_type,
-        )
-    
-    def _calculate_old_line_number(self, hunk: DiffHunk) -> int:
-        """Calculate the old line number for current position in hunk."""
-        # Count context and deletion lines processed so far
-        old_lines_count = sum(
-            1 for line in hunk.lines 
-            if line.line_type in [' ', '-']
-        )
-        return hunk.old_start + old_lines_count
-    
-    def _calculate_new_line_number(self, hunk: DiffHunk) -> int:
-        """Calculate the new line number for current position in hunk."""
-        # Count context and addition lines processed so far
-        new_lines_count = sum(
-            1 for line in hunk.lines 
-            if line.line_type in [' ', '+']
-        )
-        return hunk.new_start + new_lines_count
-    
     def parse_raw_diff(self, raw_diff: str) -> List[DiffFile]:
         """
         Parse raw git diff output into DiffFile objects.
@@ -8,12 +8,27 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from contextlib import contextmanager
 
+from pydantic import TypeAdapter
+
 from ...models.config import HistoryConfig
-from ...models.review import ReviewResult, ReviewStatus
+from ...models.review import ReviewResult, ReviewStatus, ReviewMetrics
 
 
 logger = logging.getLogger(__name__)
 
+# Validator for the metrics_data JSON column
+_METRICS_ADAPTER = TypeAdapter(ReviewMetrics)
+
+# Scalar summary columns materialized at save time so listings and
+# dashboards never have to parse the JSON payload columns; both the
+# CREATE TABLE statement and the migration of older databases use this
+SUMMARY_COLUMNS = {
+    "metrics_score": "REAL",
+    "critical_count": "INTEGER",
+    "high_count": "INTEGER",
+    "issue_count": "INTEGER",
+}
+
 
 class HistoryStorage:
     """SQLite-based storage for review history."""
@@ -41,8 +56,22 @@ class HistoryStorage:
     def _init_database(self) -> None:
         """Initialize the SQLite database with required tables."""
         with self._get_connection() as conn:
-            # Create review history table
-            conn.execute("""
+            # Add summary columns to databases created before they existed
+            existing = {row['name'] for row in conn.execute("PRAGMA table_info(review_history)")}
+            migrations = "".join(
+                f"ALTER TABLE review_history ADD COLUMN {column} {column_type};\n"
+                for column, column_type in SUMMARY_COLUMNS.items()
+                if existing and column not in existing
+            )
+            summary_columns = ",\n                    ".join(
+                f"{column} {column_type}" for column, column_type in SUMMARY_COLUMNS.items()
+            )
+            
+            # Install table, migrations and indexes in one transaction; it is
+            # committed together with the backfill below
+            conn.executescript(f"""
+                BEGIN;
+                
                 CREATE TABLE IF NOT EXISTS review_history (
                     id TEXT PRIMARY KEY,
                     status TEXT NOT NULL,
@@ -67,18 +96,63 @@ class HistoryStorage:
                     
                     -- Storage metadata
                     size_bytes INTEGER,
-                    file_count INTEGER
-                )
+                    file_count INTEGER,
+                    
+                    -- Materialized summary
+                    {summary_columns}
+                );
+                
+                {migrations}
+                
+                -- Create indexes for better performance
+                CREATE INDEX IF NOT EXISTS idx_created_at ON review_history(created_at);
+                CREATE INDEX IF NOT EXISTS idx_status ON review_history(status);
+                CREATE INDEX IF NOT EXISTS idx_ai_provider ON review_history(ai_provider);
+                CREATE INDEX IF NOT EXISTS idx_metrics_score ON review_history(metrics_score);
             """)
             
-            # Create indexes for better performance
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_created_at ON review_history(created_at)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_status ON review_history(status)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_ai_provider ON review_history(ai_provider)")
+            # Only rows from before the migration lack summary columns; rows that
+            # cannot be scored keep a NULL score, so this must not rerun
+            if migrations:
+                self._backfill_summary_columns(conn)
             
             conn.commit()
             logger.info(f"History database initialized at: {self.db_path}")
     
+    def _backfill_summary_columns(self, conn: sqlite3.Connection) -> None:
+        """Populate summary columns for rows saved before they existed."""
+        cursor = conn.execute("""
+            UPDATE review_history SET
+                critical_count = CASE WHEN json_valid(metrics_data)
+                    THEN json_extract(metrics_data, '$.critical_issues') END,
+                high_count = CASE WHEN json_valid(metrics_data)
+                    THEN json_extract(metrics_data, '$.high_issues') END,
+                issue_count = CASE WHEN json_valid(issues_data)
+                    THEN json_array_length(issues_data) END
+            WHERE issue_count IS NULL
+        """)
+        if cursor.rowcount > 0:
+            logger.info(f"Backfilled summary columns for {cursor.rowcount} history entries")
+        
+        # The score formula lives on ReviewMetrics, so compute it in Python
+        rows = conn.execute(
+            "SELECT id, metrics_data FROM review_history WHERE metrics_score IS NULL"
+        ).fetchall()
+        scores = []
+        for row in rows:
+            try:
+                metrics = _METRICS_ADAPTER.validate_json(row['metrics_data'])
+            except Exception as e:
+                logger.warning(f"Could not backfill score for review {row['id']}: {e}")
+                continue
+            scores.append((metrics.calculate_score(), row['id']))
+        
+        if scores:
+            conn.executemany(
+                "UPDATE review_history SET metrics_score = ? WHERE id = ?",
+                scores
+            )
+    
     @contextmanager
     def _get_connection(self):
         """Get a database connection with proper cleanup."""
@@ -104,24 +178,30 @@ class HistoryStorage:
             return
             
         try:
-            # Serialize complex objects to JSON
-            request_data = result.request.model_dump_json() if result.request else None
-            diff_data = result.diff.model_dump_json() if result.diff else None
-            issues_data = json.dumps([issue.model_dump() for issue in result.issues])
-            recommendations = json.dumps(result.recommendations)
-            metrics_data = result.metrics.model_dump_json() if result.metrics else None
+            # Serialize complex objects to JSON from a single model dump
+            dumped = result.model_dump(
+                mode='json',
+                include={'request', 'diff', 'issues', 'recommendations', 'metrics'},
+            )
+            request_data = self._to_json(dumped['request'])
+            diff_data = self._to_json(dumped['diff'])
+            issues_data = json.dumps(dumped['issues'])
+            recommendations = json.dumps(dumped['recommendations'])
+            metrics_data = self._to_json(dumped['metrics'])
             
             # Calculate storage metadata
             size_bytes = len(issues_data.encode()) + len(request_data.encode()) if request_data else 0
             file_count = len(result.diff.files) if result.diff else 0
+            metrics = result.metrics
             
             with self._get_connection() as conn:
                 conn.execute("""
                     INSERT OR REPLACE INTO review_history 
                     (id, status, request_data, diff_data, issues_data, summary, 
                      recommendations, metrics_data, created_at, started_at, completed_at,
-                     ai_provider, ai_model, error_message, size_bytes, file_count)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                     ai_provider, ai_model, error_message, size_bytes, file_count,
+                     metrics_score, critical_count, high_count, issue_count)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (
                     result.id,
                     result.status.value,
@@ -138,7 +218,11 @@ class HistoryStorage:
                     result.ai_model_used,
                     result.error_message,
                     size_bytes,
-                    file_count
+                    file_count,
+                    metrics.calculate_score(),
+                    metrics.critical_issues,
+                    metrics.high_issues,
+                    len(result.issues)
                 ))
                 conn.commit()
                 
@@ -150,6 +234,12 @@ class HistoryStorage:
         except Exception as e:
             logger.error(f"Failed to save review to history: {e}")
     
+    def _to_json(self, data: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Encode a dumped sub-model as compact JSON, preserving None."""
+        if data is None:
+            return None
+        return json.dumps(data, separators=(',', ':'))
+    
     def get_reviews(self, limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
         """
         Get review history entries.
@@ -169,7 +259,7 @@ class HistoryStorage:
                 cursor = conn.execute("""
                     SELECT id, status, created_at, ai_provider, ai_model, 
                            summary, size_bytes, file_count, error_message,
-                           (SELECT COUNT(*) FROM json_each(issues_data)) as issue_count
+                           issue_count, metrics_score, critical_count, high_count
                     FROM review_history 
                     ORDER BY created_at DESC 
                     LIMIT ? OFFSET ?
@@ -186,6 +276,9 @@ class HistoryStorage:
                         'summary': row['summary'],
                         'file_count': row['file_count'] or 0,
                         'issue_count': row['issue_count'] or 0,
+                        'critical_count': row['critical_count'] or 0,
+                        'high_count': row['high_count'] or 0,
+                        'metrics_score': row['metrics_score'],
                         'error_message': row['error_message']
                     })
                     
@@ -333,33 +426,26 @@ class HistoryStorage:
             
         try:
             with self._get_connection() as conn:
-                # Total entries
-                cursor = conn.execute("SELECT COUNT(*) FROM review_history")
-                total_entries = cursor.fetchone()[0]
-                
-                # Entries by status
+                # Totals and date range in one scan
                 cursor = conn.execute("""
-                    SELECT status, COUNT(*) 
-                    FROM review_history 
-                    GROUP BY status
+                    SELECT COUNT(*), MIN(created_at), MAX(created_at) 
+                    FROM review_history
                 """)
-                by_status = dict(cursor.fetchall())
+                total_entries, earliest, latest = cursor.fetchone()
                 
-                # Entries by provider
+                # Entries by status and provider, pivoted below
                 cursor = conn.execute("""
-                    SELECT ai_provider, COUNT(*) 
+                    SELECT status, ai_provider, COUNT(*) 
                     FROM review_history 
-                    WHERE ai_provider IS NOT NULL
-                    GROUP BY ai_provider
+                    GROUP BY status, ai_provider
                 """)
-                by_provider = dict(cursor.fetchall())
                 
-                # Date range
-                cursor = conn.execute("""
-                    SELECT MIN(created_at), MAX(created_at) 
-                    FROM review_history
-                """)
-                date_range = cursor.fetchone()
+                by_status: Dict[str, int] = {}
+                by_provider: Dict[str, int] = {}
+                for status, provider, count in cursor.fetchall():
+                    by_status[status] = by_status.get(status, 0) + count
+                    if provider is not None:
+                        by_provider[provider] = by_provider.get(provider, 0) + count
                 
                 return {
                     "enabled": True,
@@ -367,8 +453,8 @@ class HistoryStorage:
                     "by_status": by_status,
                     "by_provider": by_provider,
                     "date_range": {
-                        "earliest": date_range[0],
-                        "latest": date_range[1]
+                        "earliest": earliest,
+                        "latest": latest
                     },
                     "storage_path": str(self.db_path)
                 }
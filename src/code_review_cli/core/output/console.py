@@ -1,7 +1,8 @@
 """Rich console output for beautiful terminal display."""
 
 import logging
-from typing import List, Optional, Dict, Any
+import os
+from typing import List, Optional, Dict, Any, Sequence
 from datetime import datetime
 
 from rich.console import Console
@@ -230,11 +231,13 @@ class ReviewConsole:
             if line.strip():
                 self.console.print(f"   {line}")
         
+        # Try to detect language for syntax highlighting
+        _, file_ext = os.path.splitext(issue.location.file_path)
+        file_ext = file_ext[1:] or "text"
+        
         # Code snippet
         if issue.code_snippet:
             self.console.print("   [dim]Code:[/dim]")
-            # Try to detect language for syntax highlighting
-            file_ext = issue.location.file_path.split('.')[-1] if '.' in issue.location.file_path else "text"
             syntax = Syntax(
                 issue.code_snippet,
                 file_ext,
@@ -247,7 +250,6 @@ class ReviewConsole:
         # Suggested fix
         if issue.suggested_fix:
             self.console.print("   [dim]Suggested Fix:[/dim]")
-            file_ext = issue.location.file_path.split('.')[-1] if '.' in issue.location.file_path else "text"
             syntax = Syntax(
                 issue.suggested_fix,
                 file_ext,
@@ -265,7 +267,7 @@ class ReviewConsole:
         
         self.console.print()
     
-    def print_recommendations(self, recommendations: List[str]) -> None:
+    def print_recommendations(self, recommendations: Sequence[str]) -> None:
         """Print general recommendations."""
         if not recommendations:
             return
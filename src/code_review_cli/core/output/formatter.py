@@ -1,9 +1,12 @@
 """Output formatting utilities for code review results."""
 
-import json
+import functools
+import io
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
 from datetime import datetime
 
 from ...models.review import ReviewResult
@@ -12,6 +15,105 @@ from ...models.config import OutputConfig
 
 logger = logging.getLogger(__name__)
 
+# Single-pass translation table for escaping HTML special characters
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+# File extensions for saved reports
+_EXTENSIONS = {
+    "json": "json",
+    "markdown": "md",
+    "html": "html",
+    "rich": "txt",
+}
+
+# Snippets longer than this are escaped without caching to bound memory
+_ESCAPE_CACHE_MAX_LEN = 4096
+
+# Order in which severity groups appear in reports
+_SEVERITY_ORDER = ("critical", "high", "medium", "low", "info")
+
+# Static HTML document shell shared by every report
+_HTML_PREFIX = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Code Review Report</title>
+    <style>
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 40px; }
+        .header { border-bottom: 2px solid #e1e4e8; padding-bottom: 20px; margin-bottom: 30px; }
+        .metrics { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }
+        .metric-card { background: #f6f8fa; border: 1px solid #e1e4e8; border-radius: 6px; padding: 15px; }
+        .issue { border: 1px solid #e1e4e8; border-radius: 6px; margin: 15px 0; padding: 20px; }
+        .issue.critical { border-left: 4px solid #d73a49; }
+        .issue.high { border-left: 4px solid #fb8500; }
+        .issue.medium { border-left: 4px solid #ffd60a; }
+        .issue.low { border-left: 4px solid #28a745; }
+        .issue.info { border-left: 4px solid #0366d6; }
+        .code { background: #f6f8fa; border: 1px solid #e1e4e8; border-radius: 3px; padding: 10px; font-family: 'SFMono-Regular', Consolas, monospace; overflow-x: auto; }
+        .location { color: #586069; font-size: 0.9em; }
+        .confidence { background: #e1e4e8; padding: 2px 6px; border-radius: 3px; font-size: 0.8em; }
+        h1, h2, h3 { color: #24292e; }
+        .score { font-size: 1.5em; font-weight: bold; color: #28a745; }
+    </style>
+</head>
+<body>"""
+
+_HTML_SUFFIX = """
+</body>
+</html>"""
+
+# Report header, filled with str.format_map
+_HTML_HEADER = """
+
+<div class="header">
+    <h1>Code Review Report</h1>
+    <p><strong>ID:</strong> {id}</p>
+    <p><strong>Status:</strong> {status}</p>
+    <p><strong>Created:</strong> {created}</p>
+</div>"""
+
+# Metric cards, filled with str.format_map
+_HTML_METRICS = """
+
+<h2>Metrics</h2>
+<div class="metrics">
+    <div class="metric-card">
+        <h3>Files</h3>
+        <p>{files_reviewed} reviewed</p>
+    </div>
+    <div class="metric-card">
+        <h3>Changes</h3>
+        <p>+{lines_added} -{lines_deleted}</p>
+    </div>
+    <div class="metric-card">
+        <h3>Issues</h3>
+        <p>{total_issues} total</p>
+    </div>
+    <div class="metric-card">
+        <h3>Quality Score</h3>
+        <p class="score">{score:.1f}/100</p>
+    </div>
+</div>"""
+
+
+@functools.lru_cache(maxsize=1024)
+def _escape_html_cached(text: str) -> str:
+    """Escape HTML special characters, memoizing repeated snippets."""
+    return text.translate(_HTML_ESCAPE)
+
+
+def _escape_html(text: str) -> str:
+    """Escape HTML special characters."""
+    if len(text) > _ESCAPE_CACHE_MAX_LEN:
+        return text.translate(_HTML_ESCAPE)
+    return _escape_html_cached(text)
+
 
 class OutputFormatter:
     """Formats code review results for different output types."""
@@ -29,6 +131,7 @@ class OutputFormatter:
         self,
         review_result: ReviewResult,
         format_type: Optional[str] = None,
+        generated_at: Optional[str] = None,
     ) -> str:
         """
         Format review result for output.
@@ -36,258 +139,221 @@ class OutputFormatter:
         Args:
             review_result: Review result to format
             format_type: Output format (overrides config default)
+            generated_at: ISO timestamp for the report footer (defaults to now)
             
         Returns:
             Formatted output string
         """
         output_format = format_type or self.config.default_format
+        if generated_at is None:
+            generated_at = datetime.now().isoformat()
         
         if output_format == "json":
             return self._format_json(review_result)
         elif output_format == "markdown":
-            return self._format_markdown(review_result)
+            return self._format_markdown(review_result, generated_at)
         elif output_format == "html":
-            return self._format_html(review_result)
+            return self._format_html(review_result, generated_at)
         elif output_format == "rich":
             # Rich formatting is handled by ReviewConsole
             return self._format_json(review_result)
         else:
             raise ValueError(f"Unsupported output format: {output_format}")
     
+    def format_all(
+        self,
+        review_result: ReviewResult,
+        formats: Sequence[str] = ("json", "markdown", "html"),
+    ) -> Dict[str, str]:
+        """
+        Format review result into several outputs concurrently.
+        
+        Args:
+            review_result: Review result to format
+            formats: Output formats to generate
+            
+        Returns:
+            Dictionary mapping format type to formatted output
+        """
+        generated_at = datetime.now().isoformat()
+        
+        with ThreadPoolExecutor(max_workers=max(len(formats), 1)) as executor:
+            futures = {
+                format_type: executor.submit(
+                    self.format_review, review_result, format_type, generated_at
+                )
+                for format_type in formats
+            }
+            return {format_type: future.result() for format_type, future in futures.items()}
+    
     def _format_json(self, review_result: ReviewResult) -> str:
         """Format as JSON."""
-        data = review_result.dict()
-        return json.dumps(data, indent=2, default=self._json_serializer)
+        # Pydantic's serializer walks the model once, with no intermediate dict
+        return review_result.model_dump_json(indent=2)
     
-    def _format_markdown(self, review_result: ReviewResult) -> str:
+    def _format_markdown(
+        self,
+        review_result: ReviewResult,
+        generated_at: Optional[str] = None,
+    ) -> str:
         """Format as Markdown."""
-        lines = []
+        buf = io.StringIO()
         
         # Header
-        lines.append(f"# Code Review Report")
-        lines.append(f"**ID:** {review_result.id}")
-        lines.append(f"**Status:** {review_result.status.value}")
-        lines.append(f"**Created:** {review_result.created_at.isoformat()}")
-        lines.append("")
+        buf.write(f"# Code Review Report\n")
+        buf.write(f"**ID:** {review_result.id}\n")
+        buf.write(f"**Status:** {review_result.status.value}\n")
+        buf.write(f"**Created:** {review_result.created_at.isoformat()}\n\n")
         
         # Summary
         if review_result.summary:
-            lines.append("## Summary")
-            lines.append(review_result.summary)
-            lines.append("")
+            buf.write("## Summary\n")
+            buf.writelines((review_result.summary, "\n\n"))
         
         # Metrics
-        lines.append("## Metrics")
+        buf.write("## Metrics\n")
         metrics = review_result.metrics
-        lines.append(f"- **Files Reviewed:** {metrics.files_reviewed}")
-        lines.append(f"- **Lines Added:** {metrics.lines_added}")
-        lines.append(f"- **Lines Deleted:** {metrics.lines_deleted}")
-        lines.append(f"- **Total Issues:** {metrics.total_issues}")
-        lines.append(f"- **Critical:** {metrics.critical_issues}")
-        lines.append(f"- **High:** {metrics.high_issues}")
-        lines.append(f"- **Medium:** {metrics.medium_issues}")
-        lines.append(f"- **Low:** {metrics.low_issues}")
-        lines.append(f"- **Info:** {metrics.info_issues}")
-        lines.append("")
+        buf.write(f"- **Files Reviewed:** {metrics.files_reviewed}\n")
+        buf.write(f"- **Lines Added:** {metrics.lines_added}\n")
+        buf.write(f"- **Lines Deleted:** {metrics.lines_deleted}\n")
+        buf.write(f"- **Total Issues:** {metrics.total_issues}\n")
+        buf.write(f"- **Critical:** {metrics.critical_issues}\n")
+        buf.write(f"- **High:** {metrics.high_issues}\n")
+        buf.write(f"- **Medium:** {metrics.medium_issues}\n")
+        buf.write(f"- **Low:** {metrics.low_issues}\n")
+        buf.write(f"- **Info:** {metrics.info_issues}\n\n")
         
         # Score
-        score = metrics.calculate_score()
-        lines.append(f"**Quality Score:** {score:.1f}/100")
-        lines.append("")
+        buf.write(f"**Quality Score:** {metrics.calculate_score():.1f}/100\n\n")
         
         # Issues by severity
         if review_result.issues:
             # Group issues by severity
-            severity_groups = {}
+            severity_groups = defaultdict(list)
             for issue in review_result.issues:
-                severity = issue.severity.value
-                if severity not in severity_groups:
-                    severity_groups[severity] = []
-                severity_groups[severity].append(issue)
+                severity_groups[issue.severity.value].append(issue)
             
             # Output each severity group
-            for severity in ["critical", "high", "medium", "low", "info"]:
-                if severity in severity_groups:
-                    issues = severity_groups[severity]
-                    lines.append(f"## {severity.title()} Issues ({len(issues)})")
-                    lines.append("")
+            for severity in _SEVERITY_ORDER:
+                issues = severity_groups.get(severity)
+                if issues:
+                    buf.write(f"## {severity.title()} Issues ({len(issues)})\n\n")
                     
                     for issue in issues:
-                        lines.append(f"### {issue.title}")
-                        lines.append(f"**File:** `{issue.location.file_path}:{issue.location.line_range}`")
-                        lines.append(f"**Category:** {issue.category.value}")
-                        lines.append(f"**Confidence:** {issue.confidence:.1%}")
-                        lines.append("")
-                        lines.append(issue.description)
-                        lines.append("")
+                        buf.writelines((
+                            f"### {issue.title}\n",
+                            f"**File:** `{issue.location.file_path}:{issue.location.line_range}`\n",
+                            f"**Category:** {issue.category.value}\n",
+                            f"**Confidence:** {issue.confidence:.1%}\n",
+                            "\n",
+                            issue.description,
+                            "\n\n",
+                        ))
                         
                         if issue.code_snippet:
-                            lines.append("**Code:**")
-                            lines.append("```")
-                            lines.append(issue.code_snippet)
-                            lines.append("```")
-                            lines.append("")
+                            buf.writelines(("**Code:**\n```\n", issue.code_snippet, "\n```\n\n"))
                         
                         if issue.suggested_fix:
-                            lines.append("**Suggested Fix:**")
-                            lines.append("```")
-                            lines.append(issue.suggested_fix)
-                            lines.append("```")
-                            lines.append("")
+                            buf.writelines(("**Suggested Fix:**\n```\n", issue.suggested_fix, "\n```\n\n"))
                         
                         if issue.references:
-                            lines.append("**References:**")
-                            for ref in issue.references:
-                                lines.append(f"- {ref}")
-                            lines.append("")
+                            buf.write("**References:**\n")
+                            buf.writelines(f"- {ref}\n" for ref in issue.references)
+                            buf.write("\n")
                         
-                        lines.append("---")
-                        lines.append("")
+                        buf.write("---\n\n")
         
         # Recommendations
         if review_result.recommendations:
-            lines.append("## Recommendations")
-            lines.append("")
+            buf.write("## Recommendations\n\n")
             for i, rec in enumerate(review_result.recommendations, 1):
-                lines.append(f"{i}. {rec}")
-            lines.append("")
+                buf.write(f"{i}. {rec}\n")
+            buf.write("\n")
         
         # Footer
-        lines.append("---")
-        lines.append(f"*Generated by Code Review CLI at {datetime.now().isoformat()}*")
+        buf.write("---\n")
+        buf.write(f"*Generated by Code Review CLI at {generated_at or datetime.now().isoformat()}*")
         
-        return "\n".join(lines)
+        return buf.getvalue()
     
-    def _format_html(self, review_result: ReviewResult) -> str:
+    def _format_html(
+        self,
+        review_result: ReviewResult,
+        generated_at: Optional[str] = None,
+    ) -> str:
         """Format as HTML."""
-        html_parts = []
-        
-        # HTML header
-        html_parts.append("""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <title>Code Review Report</title>
-    <style>
-        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 40px; }
-        .header { border-bottom: 2px solid #e1e4e8; padding-bottom: 20px; margin-bottom: 30px; }
-        .metrics { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }
-        .metric-card { background: #f6f8fa; border: 1px solid #e1e4e8; border-radius: 6px; padding: 15px; }
-        .issue { border: 1px solid #e1e4e8; border-radius: 6px; margin: 15px 0; padding: 20px; }
-        .issue.critical { border-left: 4px solid #d73a49; }
-        .issue.high { border-left: 4px solid #fb8500; }
-        .issue.medium { border-left: 4px solid #ffd60a; }
-        .issue.low { border-left: 4px solid #28a745; }
-        .issue.info { border-left: 4px solid #0366d6; }
-        .code { background: #f6f8fa; border: 1px solid #e1e4e8; border-radius: 3px; padding: 10px; font-family: 'SFMono-Regular', Consolas, monospace; overflow-x: auto; }
-        .location { color: #586069; font-size: 0.9em; }
-        .confidence { background: #e1e4e8; padding: 2px 6px; border-radius: 3px; font-size: 0.8em; }
-        h1, h2, h3 { color: #24292e; }
-        .score { font-size: 1.5em; font-weight: bold; color: #28a745; }
-    </style>
-</head>
-<body>""")
+        html_parts = [_HTML_PREFIX]
         
         # Header
-        html_parts.append(f"""
-<div class="header">
-    <h1>Code Review Report</h1>
-    <p><strong>ID:</strong> {review_result.id}</p>
-    <p><strong>Status:</strong> {review_result.status.value}</p>
-    <p><strong>Created:</strong> {review_result.created_at.isoformat()}</p>
-</div>""")
+        html_parts.append(_HTML_HEADER.format_map({
+            "id": review_result.id,
+            "status": review_result.status.value,
+            "created": review_result.created_at.isoformat(),
+        }))
         
         # Summary
         if review_result.summary:
             html_parts.append(f"""
+
 <h2>Summary</h2>
 <p>{review_result.summary}</p>""")
         
         # Metrics
         metrics = review_result.metrics
-        score = metrics.calculate_score()
-        html_parts.append(f"""
-<h2>Metrics</h2>
-<div class="metrics">
-    <div class="metric-card">
-        <h3>Files</h3>
-        <p>{metrics.files_reviewed} reviewed</p>
-    </div>
-    <div class="metric-card">
-        <h3>Changes</h3>
-        <p>+{metrics.lines_added} -{metrics.lines_deleted}</p>
-    </div>
-    <div class="metric-card">
-        <h3>Issues</h3>
-        <p>{metrics.total_issues} total</p>
-    </div>
-    <div class="metric-card">
-        <h3>Quality Score</h3>
-        <p class="score">{score:.1f}/100</p>
-    </div>
-</div>""")
+        html_parts.append(_HTML_METRICS.format_map({
+            "files_reviewed": metrics.files_reviewed,
+            "lines_added": metrics.lines_added,
+            "lines_deleted": metrics.lines_deleted,
+            "total_issues": metrics.total_issues,
+            "score": metrics.calculate_score(),
+        }))
         
         # Issues
         if review_result.issues:
-            html_parts.append("<h2>Issues</h2>")
+            html_parts.append("\n<h2>Issues</h2>")
             
             for issue in review_result.issues:
-                html_parts.append(f"""
-<div class="issue {issue.severity.value}">
-    <h3>{issue.title}</h3>
-    <p class="location">📁 {issue.location.file_path}:{issue.location.line_range}</p>
-    <p>🏷️ {issue.category.value} | <span class="confidence">{issue.confidence:.1%} confidence</span></p>
-    <p>{issue.description}</p>""")
+                location = issue.location
+                html_parts.extend((
+                    '\n\n<div class="issue ', issue.severity.value, '">',
+                    '\n    <h3>', issue.title, '</h3>',
+                    '\n    <p class="location">📁 ', location.file_path, ':', location.line_range, '</p>',
+                    '\n    <p>🏷️ ', issue.category.value,
+                    ' | <span class="confidence">', format(issue.confidence, ".1%"), ' confidence</span></p>',
+                    '\n    <p>', issue.description, '</p>',
+                ))
                 
                 if issue.code_snippet:
-                    html_parts.append(f"""
-    <h4>Code:</h4>
-    <div class="code">{self._escape_html(issue.code_snippet)}</div>""")
+                    html_parts.extend((
+                        '\n\n    <h4>Code:</h4>\n    <div class="code">',
+                        _escape_html(issue.code_snippet),
+                        '</div>',
+                    ))
                 
                 if issue.suggested_fix:
-                    html_parts.append(f"""
-    <h4>Suggested Fix:</h4>
-    <div class="code">{self._escape_html(issue.suggested_fix)}</div>""")
+                    html_parts.extend((
+                        '\n\n    <h4>Suggested Fix:</h4>\n    <div class="code">',
+                        _escape_html(issue.suggested_fix),
+                        '</div>',
+                    ))
                 
-                html_parts.append("</div>")
+                html_parts.append("\n</div>")
         
         # Recommendations
         if review_result.recommendations:
-            html_parts.append("<h2>Recommendations</h2>")
-            html_parts.append("<ul>")
+            html_parts.append("\n<h2>Recommendations</h2>\n<ul>")
             for rec in review_result.recommendations:
-                html_parts.append(f"<li>{rec}</li>")
-            html_parts.append("</ul>")
+                html_parts.extend(("\n<li>", rec, "</li>"))
+            html_parts.append("\n</ul>")
         
         # Footer
         html_parts.append(f"""
+
 <hr>
-<p><em>Generated by Code Review CLI at {datetime.now().isoformat()}</em></p>
-</body>
-</html>""")
+<p><em>Generated by Code Review CLI at {generated_at or datetime.now().isoformat()}</em></p>""")
+        html_parts.append(_HTML_SUFFIX)
         
-        return "\n".join(html_parts)
-    
-    def _escape_html(self, text: str) -> str:
-        """Escape HTML special characters."""
-        return (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-            .replace("'", "&#x27;")
-        )
-    
-    def _json_serializer(self, obj: Any) -> Any:
-        """Custom JSON serializer for datetime and other objects."""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif hasattr(obj, 'dict'):
-            return obj.dict()
-        elif hasattr(obj, '__dict__'):
-            return obj.__dict__
-        else:
-            return str(obj)
+        return "".join(html_parts)
     
     def save_to_file(
         self,
@@ -306,25 +372,12 @@ class OutputFormatter:
         Returns:
             Path to saved file
         """
-        if not self.config.save_to_file:
-            raise ValueError("File saving is disabled in configuration")
-        
-        # Create output directory
-        output_dir = Path(self.config.output_directory)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = self._prepare_output_dir()
         
         # Generate filename if not provided
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            format_ext = format_type or self.config.default_format
-            ext_map = {
-                "json": "json",
-                "markdown": "md",
-                "html": "html",
-                "rich": "txt",
-            }
-            ext = ext_map.get(format_ext, "txt")
-            filename = f"review_{timestamp}.{ext}"
+            filename = self._default_filename(timestamp, format_type)
         
         file_path = output_dir / filename
         
@@ -334,6 +387,45 @@ class OutputFormatter:
         
         return file_path
     
+    def save_multiple(self, contents: Dict[str, str]) -> Dict[str, Path]:
+        """
+        Save several formatted outputs of the same review in one batch.
+        
+        Args:
+            contents: Mapping of output format to formatted content
+            
+        Returns:
+            Mapping of output format to saved file path
+        """
+        output_dir = self._prepare_output_dir()
+        
+        # All variants share one timestamp so they sort together
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        saved = {}
+        for format_type, content in contents.items():
+            file_path = output_dir / self._default_filename(timestamp, format_type)
+            file_path.write_text(content, encoding='utf-8')
+            saved[format_type] = file_path
+        
+        logger.info(f"Review saved to: {', '.join(str(p) for p in saved.values())}")
+        return saved
+    
+    def _prepare_output_dir(self) -> Path:
+        """Check saving is enabled and create the output directory."""
+        if not self.config.save_to_file:
+            raise ValueError("File saving is disabled in configuration")
+        
+        output_dir = Path(self.config.output_directory)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir
+    
+    def _default_filename(self, timestamp: str, format_type: Optional[str]) -> str:
+        """Build the default report filename for a format."""
+        format_ext = format_type or self.config.default_format
+        ext = _EXTENSIONS.get(format_ext, "txt")
+        return f"review_{timestamp}.{ext}"
+    
     def get_summary_stats(self, review_result: ReviewResult) -> Dict[str, Any]:
         """
         Get summary statistics for the review.
@@ -1,256 +1,73 @@
 """Template management for output formatting."""
 
+import importlib
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
-from jinja2 import Environment, BaseLoader, Template
+from jinja2 import Environment, DictLoader, FileSystemBytecodeCache, Template
+from jinja2.bccache import Bucket
 
 from ...models.review import ReviewResult
 
 
 logger = logging.getLogger(__name__)
 
+# Built-in template sources live in templates_data and are loaded on first use
+BUILTIN_TEMPLATE_NAMES = ("summary", "slack", "github_comment", "email")
+
+
+class _UserBytecodeCache(FileSystemBytecodeCache):
+    """Per-user bytecode cache that skips caching on I/O errors."""
+    
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Load cached bytecode, compiling from source if it cannot be read."""
+        try:
+            super().load_bytecode(bucket)
+        except OSError as e:
+            logger.debug(f"Template bytecode cache read failed: {e}")
+    
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """Store compiled bytecode, ignoring write failures."""
+        try:
+            super().dump_bytecode(bucket)
+        except OSError as e:
+            logger.debug(f"Template bytecode cache write failed: {e}")
+
 
 class TemplateManager:
     """Manages output templates for various formats."""
     
     def __init__(self):
-        """Initialize template manager with built-in templates."""
+        """Initialize template manager; built-in templates load on first use."""
         self.templates: Dict[str, str] = {}
-        self.jinja_env = Environment(loader=BaseLoader())
-        self._load_builtin_templates()
+        self._compiled: Dict[str, Template] = {}
+        self.jinja_env = Environment(
+            loader=DictLoader(self.templates),
+            bytecode_cache=self._create_bytecode_cache(),
+            auto_reload=False,
+            cache_size=0,  # Compiled templates are cached in self._compiled
+        )
     
-    def _load_builtin_templates(self) -> None:
-        """Load built-in templates."""
-        # Simple text summary template
-        self.templates["summary"] = """
-Review Summary for {{ review.id }}
-=================================
-Status: {{ review.status.value }}
-Files: {{ review.metrics.files_reviewed }}
-Issues: {{ review.metrics.total_issues }} (Critical: {{ review.metrics.critical_issues }}, High: {{ review.metrics.high_issues }})
-Score: {{ "%.1f"|format(review.metrics.calculate_score()) }}/100
-Approved: {{ "Yes" if review.is_approved() else "No" }}
-        """.strip()
-        
-        # Slack/Teams notification template
-        self.templates["slack"] = """
-{
-    "text": "Code Review Complete",
-    "blocks": [
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": "🔍 Code Review Report"
-            }
-        },
-        {
-            "type": "section",
-            "fields": [
-                {
-                    "type": "mrkdwn",
-                    "text": "*Repository:* {{ review.diff.repository or 'Unknown' }}"
-                },
-                {
-                    "type": "mrkdwn", 
-                    "text": "*Branch:* {{ review.diff.source_branch }} → {{ review.diff.target_branch }}"
-                },
-                {
-                    "type": "mrkdwn",
-                    "text": "*Files:* {{ review.metrics.files_reviewed }}"
-                },
-                {
-                    "type": "mrkdwn",
-                    "text": "*Issues:* {{ review.metrics.total_issues }}"
-                }
-            ]
-        },
-        {% if review.metrics.total_issues > 0 %}
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": "*Issue Breakdown:*\\n🚨 Critical: {{ review.metrics.critical_issues }}\\n⚠️ High: {{ review.metrics.high_issues }}\\n⚡ Medium: {{ review.metrics.medium_issues }}\\n💡 Low: {{ review.metrics.low_issues }}\\nℹ️ Info: {{ review.metrics.info_issues }}"
-            }
-        },
-        {% endif %}
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": "*Quality Score:* {{ "%.1f"|format(review.metrics.calculate_score()) }}/100"
-            }
-        },
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": "{% if review.is_approved() %}✅ *APPROVED* - Ready to merge!{% else %}❌ *NEEDS ATTENTION* - {{ review.get_blocking_issues()|length }} blocking issue(s){% endif %}"
-            }
-        }
-    ]
-}
-        """.strip()
-        
-        # GitHub PR comment template  
-        self.templates["github_comment"] = """
-## 🔍 Code Review Report
-
-**Review ID:** `{{ review.id }}`  
-**Status:** {{ review.status.value }}  
-**Quality Score:** {{ "%.1f"|format(review.metrics.calculate_score()) }}/100
-
-### 📊 Summary
-- **Files Reviewed:** {{ review.metrics.files_reviewed }}
-- **Lines Changed:** +{{ review.metrics.lines_added }} -{{ review.metrics.lines_deleted }}
-- **Total Issues:** {{ review.metrics.total_issues }}
-
-{% if review.metrics.total_issues > 0 %}
-### 🐛 Issues Found
-| Severity | Count |
-|----------|-------|
-{% if review.metrics.critical_issues > 0 %}| 🚨 Critical | {{ review.metrics.critical_issues }} |
-{% endif %}
-{% if review.metrics.high_issues > 0 %}| ⚠️ High | {{ review.metrics.high_issues }} |
-{% endif %}
-{% if review.metrics.medium_issues > 0 %}| ⚡ Medium | {{ review.metrics.medium_issues }} |
-{% endif %}
-{% if review.metrics.low_issues > 0 %}| 💡 Low | {{ review.metrics.low_issues }} |
-{% endif %}
-{% if review.metrics.info_issues > 0 %}| ℹ️ Info | {{ review.metrics.info_issues }} |
-{% endif %}
-
-{% for issue in review.issues[:5] %}
-#### {{ loop.index }}. {{ issue.title }}
-**File:** `{{ issue.location.file_path }}:{{ issue.location.line_range }}`  
-**Severity:** {{ issue.severity.value.title() }} | **Category:** {{ issue.category.value }}
-
-{{ issue.description }}
-
-{% if issue.code_snippet %}
-<details>
-<summary>Show Code</summary>
-
-```{{ issue.location.file_path.split('.')[-1] if '.' in issue.location.file_path else 'text' }}
-{{ issue.code_snippet }}
-```
-</details>
-{% endif %}
-
-{% if issue.suggested_fix %}
-<details>
-<summary>Suggested Fix</summary>
-
-```{{ issue.location.file_path.split('.')[-1] if '.' in issue.location.file_path else 'text' }}
-{{ issue.suggested_fix }}
-```
-</details>
-{% endif %}
-
----
-{% endfor %}
-
-{% if review.issues|length > 5 %}
-*... and {{ review.issues|length - 5 }} more issues. See full report for details.*
-{% endif %}
-{% endif %}
-
-### 🎯 Recommendations
-{% for rec in review.recommendations %}
-- {{ rec }}
-{% endfor %}
-
-### ✅ Approval Status
-{% if review.is_approved() %}
-**✅ APPROVED** - No blocking issues found. Ready to merge!
-{% else %}
-**❌ NEEDS ATTENTION** - {{ review.get_blocking_issues()|length }} blocking issue(s) require fixes before merging.
-{% endif %}
-
----
-*Generated by Code Review CLI*
-        """.strip()
-        
-        # Email template
-        self.templates["email"] = """
-Subject: Code Review Complete - {{ review.diff.repository }} ({{ review.diff.source_branch }} → {{ review.diff.target_branch }})
-
-Code Review Report
-==================
-
-Review ID: {{ review.id }}
-Repository: {{ review.diff.repository or 'Unknown' }}
-Branch: {{ review.diff.source_branch }} → {{ review.diff.target_branch }}
-Status: {{ review.status.value }}
-Generated: {{ review.created_at.strftime('%Y-%m-%d %H:%M:%S') }}
-
-Summary
--------
-{% if review.summary %}
-{{ review.summary }}
-{% endif %}
-
-Metrics
--------
-Files Reviewed: {{ review.metrics.files_reviewed }}
-Lines Added: {{ review.metrics.lines_added }}
-Lines Deleted: {{ review.metrics.lines_deleted }}
-Total Issues: {{ review.metrics.total_issues }}
-Quality Score: {{ "%.1f"|format(review.metrics.calculate_score()) }}/100
-
-{% if review.metrics.total_issues > 0 %}
-Issue Breakdown:
-- Critical: {{ review.metrics.critical_issues }}
-- High: {{ review.metrics.high_issues }}
-- Medium: {{ review.metrics.medium_issues }}
-- Low: {{ review.metrics.low_issues }}
-- Info: {{ review.metrics.info_issues }}
-{% endif %}
-
-{% if review.issues %}
-Issues Found
-------------
-{% for issue in review.issues %}
-{{ loop.index }}. {{ issue.title }}
-   File: {{ issue.location.file_path }}:{{ issue.location.line_range }}
-   Severity: {{ issue.severity.value.title() }}
-   Category: {{ issue.category.value }}
-   
-   {{ issue.description }}
-   
-{% if issue.code_snippet %}
-   Code:
-   {{ issue.code_snippet | indent(3) }}
-{% endif %}
-{% if issue.suggested_fix %}
-   
-   Suggested Fix:
-   {{ issue.suggested_fix | indent(3) }}
-{% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if review.recommendations %}
-Recommendations
----------------
-{% for rec in review.recommendations %}
-{{ loop.index }}. {{ rec }}
-{% endfor %}
-{% endif %}
-
-Approval Status
----------------
-{% if review.is_approved() %}
-✅ APPROVED - No blocking issues found. Ready to merge!
-{% else %}
-❌ NEEDS ATTENTION - {{ review.get_blocking_issues()|length }} blocking issue(s) require fixes before merging.
-{% endif %}
-
---
-Generated by Code Review CLI
-        """.strip()
+    def _create_bytecode_cache(self) -> Optional[FileSystemBytecodeCache]:
+        """Create an on-disk bytecode cache reused across CLI runs."""
+        try:
+            # Without a directory, jinja uses a per-user 0700 temp folder
+            # and refuses one that is owned by someone else
+            return _UserBytecodeCache()
+        except Exception as e:
+            logger.debug(f"Template bytecode cache disabled: {e}")
+            return None
+    
+    def _load_builtin(self, name: str) -> str:
+        """Load a built-in template source, importing the data module on demand."""
+        data = importlib.import_module(".templates_data", __package__)
+        return data.BUILTIN_TEMPLATES[name]
+    
+    def _ensure_loaded(self, template_name: str) -> bool:
+        """Make sure a template source is available, loading built-ins lazily."""
+        if template_name not in self.templates and template_name in BUILTIN_TEMPLATE_NAMES:
+            self.templates[template_name] = self._load_builtin(template_name)
+        return template_name in self.templates
     
     def render_template(
         self,
@@ -269,15 +86,18 @@ Generated by Code Review CLI
         Returns:
             Rendered template string
         """
-        if template_name not in self.templates:
+        if not self._ensure_loaded(template_name):
             raise ValueError(f"Template '{template_name}' not found")
         
-        template_str = self.templates[template_name]
-        template = self.jinja_env.from_string(template_str)
+        template = self._get_compiled(template_name)
         
-        # Prepare template variables
+        # Prepare template variables; derived values are computed once here
+        # rather than re-evaluated by every template expression that uses them
         template_vars = {
             "review": review_result,
+            "score": review_result.metrics.calculate_score(),
+            "approved": review_result.is_approved(),
+            "blocking_count": len(review_result.get_blocking_issues()),
             **kwargs
         }
         
@@ -287,6 +107,14 @@ Generated by Code Review CLI
             logger.error(f"Template rendering failed: {e}")
             raise ValueError(f"Template rendering error: {e}")
     
+    def _get_compiled(self, template_name: str) -> Template:
+        """Get the compiled template, compiling and caching it on first use."""
+        template = self._compiled.get(template_name)
+        if template is None:
+            template = self.jinja_env.get_template(template_name)
+            self._compiled[template_name] = template
+        return template
+    
     def add_template(self, name: str, template_str: str) -> None:
         """
         Add a custom template.
@@ -296,6 +124,7 @@ Generated by Code Review CLI
             template_str: Template string (Jinja2 format)
         """
         self.templates[name] = template_str
+        self._compiled.pop(name, None)
         logger.info(f"Added template: {name}")
     
     def load_template_from_file(self, name: str, file_path: Path) -> None:
@@ -328,7 +157,9 @@ Generated by Code Review CLI
         }
         
         result = {}
-        for name in self.templates.keys():
+        names = dict.fromkeys(BUILTIN_TEMPLATE_NAMES)
+        names.update(dict.fromkeys(self.templates))
+        for name in names:
             result[name] = descriptions.get(name, "Custom template")
         
         return result
@@ -344,7 +175,7 @@ Generated by Code Review CLI
         Returns:
             Template preview
         """
-        if template_name not in self.templates:
+        if not self._ensure_loaded(template_name):
             return "Template not found"
         
         template_str = self.templates[template_name]
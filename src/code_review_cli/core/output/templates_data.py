@@ -0,0 +1,239 @@
+"""Built-in output template sources, imported on first use."""
+
+# Simple text summary template
+SUMMARY_TEMPLATE = """
+Review Summary for {{ review.id }}
+=================================
+Status: {{ review.status.value }}
+Files: {{ review.metrics.files_reviewed }}
+Issues: {{ review.metrics.total_issues }} (Critical: {{ review.metrics.critical_issues }}, High: {{ review.metrics.high_issues }})
+Score: {{ "%.1f"|format(score) }}/100
+Approved: {{ "Yes" if approved else "No" }}
+""".strip()
+
+# Slack/Teams notification template
+SLACK_TEMPLATE = """
+{
+    "text": "Code Review Complete",
+    "blocks": [
+        {
+            "type": "header",
+            "text": {
+                "type": "plain_text",
+                "text": "🔍 Code Review Report"
+            }
+        },
+        {
+            "type": "section",
+            "fields": [
+                {
+                    "type": "mrkdwn",
+                    "text": "*Repository:* {{ review.diff.repository or 'Unknown' }}"
+                },
+                {
+                    "type": "mrkdwn", 
+                    "text": "*Branch:* {{ review.diff.source_branch }} → {{ review.diff.target_branch }}"
+                },
+                {
+                    "type": "mrkdwn",
+                    "text": "*Files:* {{ review.metrics.files_reviewed }}"
+                },
+                {
+                    "type": "mrkdwn",
+                    "text": "*Issues:* {{ review.metrics.total_issues }}"
+                }
+            ]
+        },
+        {% if review.metrics.total_issues > 0 %}
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": "*Issue Breakdown:*\\n🚨 Critical: {{ review.metrics.critical_issues }}\\n⚠️ High: {{ review.metrics.high_issues }}\\n⚡ Medium: {{ review.metrics.medium_issues }}\\n💡 Low: {{ review.metrics.low_issues }}\\nℹ️ Info: {{ review.metrics.info_issues }}"
+            }
+        },
+        {% endif %}
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": "*Quality Score:* {{ "%.1f"|format(score) }}/100"
+            }
+        },
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": "{% if approved %}✅ *APPROVED* - Ready to merge!{% else %}❌ *NEEDS ATTENTION* - {{ blocking_count }} blocking issue(s){% endif %}"
+            }
+        }
+    ]
+}
+""".strip()
+
+# GitHub PR comment template
+GITHUB_COMMENT_TEMPLATE = """
+## 🔍 Code Review Report
+
+**Review ID:** `{{ review.id }}`  
+**Status:** {{ review.status.value }}  
+**Quality Score:** {{ "%.1f"|format(score) }}/100
+
+### 📊 Summary
+- **Files Reviewed:** {{ review.metrics.files_reviewed }}
+- **Lines Changed:** +{{ review.metrics.lines_added }} -{{ review.metrics.lines_deleted }}
+- **Total Issues:** {{ review.metrics.total_issues }}
+
+{% if review.metrics.total_issues > 0 %}
+### 🐛 Issues Found
+| Severity | Count |
+|----------|-------|
+{% if review.metrics.critical_issues > 0 %}| 🚨 Critical | {{ review.metrics.critical_issues }} |
+{% endif %}
+{% if review.metrics.high_issues > 0 %}| ⚠️ High | {{ review.metrics.high_issues }} |
+{% endif %}
+{% if review.metrics.medium_issues > 0 %}| ⚡ Medium | {{ review.metrics.medium_issues }} |
+{% endif %}
+{% if review.metrics.low_issues > 0 %}| 💡 Low | {{ review.metrics.low_issues }} |
+{% endif %}
+{% if review.metrics.info_issues > 0 %}| ℹ️ Info | {{ review.metrics.info_issues }} |
+{% endif %}
+
+{% for issue in review.issues[:5] %}
+#### {{ loop.index }}. {{ issue.title }}
+**File:** `{{ issue.location.file_path }}:{{ issue.location.line_range }}`  
+**Severity:** {{ issue.severity.value.title() }} | **Category:** {{ issue.category.value }}
+
+{{ issue.description }}
+
+{% if issue.code_snippet %}
+<details>
+<summary>Show Code</summary>
+
+```{{ issue.location.file_path.split('.')[-1] if '.' in issue.location.file_path else 'text' }}
+{{ issue.code_snippet }}
+```
+</details>
+{% endif %}
+
+{% if issue.suggested_fix %}
+<details>
+<summary>Suggested Fix</summary>
+
+```{{ issue.location.file_path.split('.')[-1] if '.' in issue.location.file_path else 'text' }}
+{{ issue.suggested_fix }}
+```
+</details>
+{% endif %}
+
+---
+{% endfor %}
+
+{% if review.issues|length > 5 %}
+*... and {{ review.issues|length - 5 }} more issues. See full report for details.*
+{% endif %}
+{% endif %}
+
+### 🎯 Recommendations
+{% for rec in review.recommendations %}
+- {{ rec }}
+{% endfor %}
+
+### ✅ Approval Status
+{% if approved %}
+**✅ APPROVED** - No blocking issues found. Ready to merge!
+{% else %}
+**❌ NEEDS ATTENTION** - {{ blocking_count }} blocking issue(s) require fixes before merging.
+{% endif %}
+
+---
+*Generated by Code Review CLI*
+""".strip()
+
+# Email template
+EMAIL_TEMPLATE = """
+Subject: Code Review Complete - {{ review.diff.repository }} ({{ review.diff.source_branch }} → {{ review.diff.target_branch }})
+
+Code Review Report
+==================
+
+Review ID: {{ review.id }}
+Repository: {{ review.diff.repository or 'Unknown' }}
+Branch: {{ review.diff.source_branch }} → {{ review.diff.target_branch }}
+Status: {{ review.status.value }}
+Generated: {{ review.created_at.strftime('%Y-%m-%d %H:%M:%S') }}
+
+Summary
+-------
+{% if review.summary %}
+{{ review.summary }}
+{% endif %}
+
+Metrics
+-------
+Files Reviewed: {{ review.metrics.files_reviewed }}
+Lines Added: {{ review.metrics.lines_added }}
+Lines Deleted: {{ review.metrics.lines_deleted }}
+Total Issues: {{ review.metrics.total_issues }}
+Quality Score: {{ "%.1f"|format(score) }}/100
+
+{% if review.metrics.total_issues > 0 %}
+Issue Breakdown:
+- Critical: {{ review.metrics.critical_issues }}
+- High: {{ review.metrics.high_issues }}
+- Medium: {{ review.metrics.medium_issues }}
+- Low: {{ review.metrics.low_issues }}
+- Info: {{ review.metrics.info_issues }}
+{% endif %}
+
+{% if review.issues %}
+Issues Found
+------------
+{% for issue in review.issues %}
+{{ loop.index }}. {{ issue.title }}
+   File: {{ issue.location.file_path }}:{{ issue.location.line_range }}
+   Severity: {{ issue.severity.value.title() }}
+   Category: {{ issue.category.value }}
+   
+   {{ issue.description }}
+   
+{% if issue.code_snippet %}
+   Code:
+   {{ issue.code_snippet | indent(3) }}
+{% endif %}
+{% if issue.suggested_fix %}
+   
+   Suggested Fix:
+   {{ issue.suggested_fix | indent(3) }}
+{% endif %}
+
+{% endfor %}
+{% endif %}
+
+{% if review.recommendations %}
+Recommendations
+---------------
+{% for rec in review.recommendations %}
+{{ loop.index }}. {{ rec }}
+{% endfor %}
+{% endif %}
+
+Approval Status
+---------------
+{% if approved %}
+✅ APPROVED - No blocking issues found. Ready to merge!
+{% else %}
+❌ NEEDS ATTENTION - {{ blocking_count }} blocking issue(s) require fixes before merging.
+{% endif %}
+
+--
+Generated by Code Review CLI
+""".strip()
+
+
+BUILTIN_TEMPLATES = {
+    "summary": SUMMARY_TEMPLATE,
+    "slack": SLACK_TEMPLATE,
+    "github_comment": GITHUB_COMMENT_TEMPLATE,
+    "email": EMAIL_TEMPLATE,
+}
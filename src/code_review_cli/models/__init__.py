@@ -1,9 +1,26 @@
 """Data models package."""
 
-from .review import Review, ReviewRequest, ReviewResult, ReviewStatus, ReviewFocus, ReviewMetrics
+from typing import Any
+
+from .review import (
+    Review, ReviewRequest, ReviewResult, ReviewStatus, ReviewFocus, ReviewMetrics,
+    ReviewMetricsTable, AIParams, ReviewSummary,
+)
 from .issue import Issue, IssueSeverity, IssueCategory, IssueLocation
 from .diff import DiffFile, DiffHunk, GitDiff, DiffLine, DiffStats, ChangeType
-from .config import Config, AIConfig, OutputConfig, GitConfig, CacheConfig, ReviewConfig
+
+# Configuration models are imported on first access, so importing the
+# package does not build their schemas unless they are used
+_CONFIG_MODELS = ("Config", "AIConfig", "OutputConfig", "GitConfig", "CacheConfig", "ReviewConfig")
+
+
+def __getattr__(name: str) -> Any:
+    """Import configuration models on first access."""
+    if name in _CONFIG_MODELS:
+        from . import config
+        return getattr(config, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Review models
@@ -13,6 +30,9 @@ __all__ = [
     "ReviewStatus",
     "ReviewFocus",
     "ReviewMetrics",
+    "ReviewMetricsTable",
+    "AIParams",
+    "ReviewSummary",
     
     # Issue models
     "Issue",
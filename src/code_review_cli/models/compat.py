@@ -0,0 +1,9 @@
+"""Python version compatibility helpers for the data models."""
+
+import sys
+from typing import Any, Dict
+
+
+# Keyword arguments for @dataclass: slotted dataclasses need Python 3.10+,
+# older versions fall back to __dict__
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -2,14 +2,14 @@
 Configuration models for the code review CLI.
 """
 
-from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, Field, validator
+from typing import Dict, List, Literal, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AIConfig(BaseModel):
     """AI provider configuration."""
     
-    provider: str = Field(default="openai", description="AI provider: openai, anthropic, mistral, ollama, gemini")
+    provider: Literal["openai", "anthropic", "mistral", "ollama", "gemini"] = Field(default="openai", description="AI provider: openai, anthropic, mistral, ollama, gemini")
     model: str = Field(default="gpt-4", description="Model name")
     temperature: float = Field(default=0.1, ge=0.0, le=2.0, description="Temperature for generation")
     max_tokens: int = Field(default=4000, ge=1, le=32000, description="Maximum tokens to generate")
@@ -36,12 +36,6 @@ class AIConfig(BaseModel):
     max_retries: int = Field(default=3, description="Maximum retry attempts")
     retry_delay: float = Field(default=1.0, description="Delay between retries in seconds")
     timeout: float = Field(default=60.0, description="Request timeout in seconds")
-    
-    @validator('provider')
-    def validate_provider(cls, v):
-        if v not in ['openai', 'anthropic', 'mistral', 'ollama', 'gemini']:
-            raise ValueError('Provider must be one of: openai, anthropic, mistral, ollama, gemini')
-        return v
 
 
 class GitConfig(BaseModel):
@@ -58,7 +52,7 @@ class GitConfig(BaseModel):
 class OutputConfig(BaseModel):
     """Output configuration."""
     
-    format: str = Field(default="rich", description="Output format: rich, json, markdown, html")
+    format: Literal["rich", "json", "markdown", "html"] = Field(default="rich", description="Output format: rich, json, markdown, html")
     show_progress: bool = Field(default=True, description="Show progress bars")
     show_metrics: bool = Field(default=True, description="Show review metrics")
     show_suggestions: bool = Field(default=True, description="Show improvement suggestions")
@@ -67,12 +61,6 @@ class OutputConfig(BaseModel):
     # Console-specific settings
     console_width: Optional[int] = Field(default=None, description="Console width (auto-detect if None)")
     color_enabled: bool = Field(default=True, description="Enable colored output")
-    
-    @validator('format')
-    def validate_format(cls, v):
-        if v not in ['rich', 'json', 'markdown', 'html']:
-            raise ValueError('Format must be one of: rich, json, markdown, html')
-        return v
 
 
 class CacheConfig(BaseModel):
@@ -88,36 +76,18 @@ class HistoryConfig(BaseModel):
     """History configuration."""
     
     enabled: bool = Field(default=False, description="Enable review history tracking")
-    max_entries: int = Field(default=1000, description="Maximum number of reviews to keep in history")
-    retention_days: int = Field(default=30, description="Days to keep history entries before cleanup")
+    max_entries: int = Field(default=1000, ge=1, description="Maximum number of reviews to keep in history")
+    retention_days: int = Field(default=30, ge=1, description="Days to keep history entries before cleanup")
     storage_path: Optional[str] = Field(default=None, description="Custom path for history storage (defaults to ~/.config/unc/history)")
-    
-    @validator('max_entries')
-    def validate_max_entries(cls, v):
-        if v < 1:
-            raise ValueError('max_entries must be at least 1')
-        return v
-    
-    @validator('retention_days')
-    def validate_retention_days(cls, v):
-        if v < 1:
-            raise ValueError('retention_days must be at least 1')
-        return v
 
 
 class ReviewConfig(BaseModel):
     """Review configuration."""
     
     default_focus: List[str] = Field(default=[], description="Default focus areas")
-    severity_threshold: str = Field(default="LOW", description="Minimum severity to report")
+    severity_threshold: Literal["CRITICAL", "HIGH", "MEDIUM", "LOW"] = Field(default="LOW", description="Minimum severity to report")
     max_files_per_review: int = Field(default=100, description="Maximum files per review")
     timeout_seconds: int = Field(default=300, description="Review timeout in seconds")
-    
-    @validator('severity_threshold')
-    def validate_severity(cls, v):
-        if v not in ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']:
-            raise ValueError('Severity must be one of: CRITICAL, HIGH, MEDIUM, LOW')
-        return v
 
 
 class Config(BaseModel):
@@ -134,6 +104,4 @@ class Config(BaseModel):
     version: str = Field(default="1.0.0", description="Configuration version")
     created_at: Optional[str] = Field(default=None, description="Configuration creation timestamp")
     
-    class Config:
-        extra = "forbid"
-        validate_assignment = True 
\ No newline at end of file
+    model_config = ConfigDict(extra="forbid") 
\ No newline at end of file
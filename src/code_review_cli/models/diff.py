@@ -1,9 +1,12 @@
 """Git diff data models."""
 
+from dataclasses import dataclass
 from enum import Enum
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 
+from .compat import DATACLASS_SLOTS
+
 
 class ChangeType(str, Enum):
     """Types of changes in a diff."""
@@ -15,14 +18,15 @@ class ChangeType(str, Enum):
     COPIED = "copied"
 
 
-class DiffLine(BaseModel):
+@dataclass(**DATACLASS_SLOTS)
+class DiffLine:
     """Represents a single line in a diff."""
     
-    line_number: Optional[int] = Field(None, description="Line number in the file")
-    old_line_number: Optional[int] = Field(None, description="Line number in old file")
-    new_line_number: Optional[int] = Field(None, description="Line number in new file")
-    content: str = Field(..., description="Content of the line")
-    line_type: str = Field(..., description="Type of line ('+', '-', ' ', etc.)")
+    content: str  # Content of the line
+    line_type: str  # Type of line ('+', '-', ' ', etc.)
+    line_number: Optional[int] = None  # Line number in the file
+    old_line_number: Optional[int] = None  # Line number in old file
+    new_line_number: Optional[int] = None  # Line number in new file
     
     @property
     def is_addition(self) -> bool:
@@ -58,28 +62,34 @@ class DiffHunk(BaseModel):
             header += f" {self.section_header}"
         return header
     
+    @property
+    def line_types(self) -> str:
+        """Get the type of every line in this hunk, one character per line."""
+        return "".join([line.line_type for line in self.lines])
+    
     @property
     def added_lines(self) -> List[DiffLine]:
         """Get all added lines in this hunk."""
-        return [line for line in self.lines if line.is_addition]
+        return [line for line in self.lines if line.line_type == "+"]
     
     @property
     def deleted_lines(self) -> List[DiffLine]:
         """Get all deleted lines in this hunk."""
-        return [line for line in self.lines if line.is_deletion]
+        return [line for line in self.lines if line.line_type == "-"]
     
     @property
     def context_lines(self) -> List[DiffLine]:
         """Get all context lines in this hunk."""
-        return [line for line in self.lines if line.is_context]
+        return [line for line in self.lines if line.line_type == " "]
 
 
-class DiffStats(BaseModel):
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class DiffStats:
     """Statistics about changes in a diff."""
     
-    additions: int = Field(default=0, description="Number of lines added")
-    deletions: int = Field(default=0, description="Number of lines deleted")
-    changes: int = Field(default=0, description="Total number of changes")
+    additions: int = 0  # Number of lines added
+    deletions: int = 0  # Number of lines deleted
+    changes: int = 0  # Total number of changes
     
     @property
     def net_change(self) -> int:
@@ -141,15 +151,17 @@ class DiffFile(BaseModel):
     
     def get_extension(self) -> Optional[str]:
         """Get file extension."""
-        path = self.path
-        if '.' in path:
-            return path.split('.')[-1].lower()
-        return None
+        _, dot, extension = self.path.rpartition('.')
+        return extension.lower() if dot else None
     
     def calculate_stats(self) -> None:
         """Calculate statistics from hunks."""
-        additions = sum(len(hunk.added_lines) for hunk in self.hunks)
-        deletions = sum(len(hunk.deleted_lines) for hunk in self.hunks)
+        additions = 0
+        deletions = 0
+        for hunk in self.hunks:
+            line_types = hunk.line_types
+            additions += line_types.count("+")
+            deletions += line_types.count("-")
         self.stats = DiffStats(
             additions=additions,
             deletions=deletions,
@@ -178,13 +190,32 @@ class GitDiff(BaseModel):
     
     def calculate_totals(self) -> None:
         """Calculate total statistics from all files."""
+        total_additions = 0
+        total_deletions = 0
+        for file in self.files:
+            total_additions += file.stats.additions
+            total_deletions += file.stats.deletions
+        
         self.total_files = len(self.files)
-        self.total_additions = sum(file.stats.additions for file in self.files)
-        self.total_deletions = sum(file.stats.deletions for file in self.files)
+        self.total_additions = total_additions
+        self.total_deletions = total_deletions
+    
+    def add_file(self, file: DiffFile) -> None:
+        """
+        Add a file to the diff, updating totals incrementally.
+        
+        Args:
+            file: File to add
+        """
+        self.files.append(file)
+        self.total_files += 1
+        self.total_additions += file.stats.additions
+        self.total_deletions += file.stats.deletions
     
     def get_files_by_extension(self, extension: str) -> List[DiffFile]:
         """Get files with specific extension."""
-        return [f for f in self.files if f.get_extension() == extension.lower()]
+        extension = extension.lower()
+        return [f for f in self.files if f.get_extension() == extension]
     
     def get_files_by_change_type(self, change_type: ChangeType) -> List[DiffFile]:
         """Get files with specific change type."""
@@ -207,13 +238,25 @@ class GitDiff(BaseModel):
     
     def to_summary(self) -> Dict[str, Any]:
         """Generate a summary of the diff."""
+        # Count every file status in a single pass over the files
+        new_files = deleted_files = modified_files = binary_files = 0
+        for file in self.files:
+            if file.is_new_file:
+                new_files += 1
+            if file.is_deleted_file:
+                deleted_files += 1
+            if file.is_modified:
+                modified_files += 1
+            if file.binary:
+                binary_files += 1
+        
         return {
             "total_files": self.total_files,
             "total_additions": self.total_additions,
             "total_deletions": self.total_deletions,
             "net_change": self.total_additions - self.total_deletions,
-            "new_files": len(self.new_files),
-            "deleted_files": len(self.deleted_files),
-            "modified_files": len(self.modified_files),
-            "binary_files": len([f for f in self.files if f.binary]),
-        } 
\ No newline at end of file
+            "new_files": new_files,
+            "deleted_files": deleted_files,
+            "modified_files": modified_files,
+            "binary_files": binary_files,
+        }
\ No newline at end of file
@@ -1,8 +1,9 @@
 """Issue data models for code review results."""
 
+import sys
 from enum import Enum
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class IssueSeverity(str, Enum):
@@ -15,6 +16,10 @@ class IssueSeverity(str, Enum):
     INFO = "info"
 
 
+# Severities that block a review from being approved
+BLOCKING_SEVERITIES = frozenset({IssueSeverity.CRITICAL, IssueSeverity.HIGH})
+
+
 class IssueCategory(str, Enum):
     """Categories for code review issues."""
     
@@ -39,6 +44,12 @@ class IssueLocation(BaseModel):
     column_start: Optional[int] = Field(None, description="Starting column (1-indexed)")
     column_end: Optional[int] = Field(None, description="Ending column")
     
+    @field_validator('file_path')
+    @classmethod
+    def intern_file_path(cls, v: str) -> str:
+        # Many issues point at the same few files; share one string per path
+        return sys.intern(v)
+    
     @property
     def line_range(self) -> str:
         """Get a human-readable line range."""
@@ -78,21 +89,18 @@ class Issue(BaseModel):
     detected_by: str = Field(default="ai", description="Tool/method that detected this issue")
     created_at: Optional[str] = Field(None, description="ISO timestamp when issue was created")
     
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            IssueSeverity: lambda v: v.value,
-            IssueCategory: lambda v: v.value,
-        }
-        
     def is_blocking(self) -> bool:
         """Check if this issue should block the review."""
-        return self.severity in [IssueSeverity.CRITICAL, IssueSeverity.HIGH]
+        return self.severity in BLOCKING_SEVERITIES
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return self.model_dump()
     
+    def to_json(self) -> str:
+        """Serialize to JSON in one pass, without an intermediate dict."""
+        return self.model_dump_json()
+    
     def format_location(self) -> str:
         """Format location for display."""
         location = f"{self.location.file_path}:{self.location.line_range}"
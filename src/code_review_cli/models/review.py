@@ -1,11 +1,19 @@
 """Review data models for code review operations."""
 
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-from pydantic import BaseModel, Field
+import functools
+import hashlib
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Iterable, List, NamedTuple, Optional, Dict, Any, Tuple, Union
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
+from typing_extensions import Annotated
 from enum import Enum
 
-from .issue import Issue, IssueSeverity
+from .issue import BLOCKING_SEVERITIES, Issue, IssueSeverity
+from .compat import DATACLASS_SLOTS
 from .diff import GitDiff
 
 
@@ -31,6 +39,19 @@ class ReviewFocus(str, Enum):
     TESTING = "testing"
 
 
+class AIParams(BaseModel):
+    """Immutable, hashable AI settings of a review request."""
+    
+    model_config = ConfigDict(frozen=True)
+    
+    ai_provider: Optional[str] = Field(None, description="AI provider to use")
+    ai_model: Optional[str] = Field(None, description="AI model to use")
+    temperature: float = Field(0.2, ge=0.0, le=2.0, description="AI temperature setting")
+    focus: ReviewFocus = Field(ReviewFocus.GENERAL, description="Primary focus area")
+    context: Optional[str] = Field(None, description="Additional context for the review")
+    custom_prompt: Optional[str] = Field(None, description="Custom prompt to use")
+
+
 class ReviewRequest(BaseModel):
     """Request for a code review."""
     
@@ -41,8 +62,8 @@ class ReviewRequest(BaseModel):
     
     # Review parameters
     focus: ReviewFocus = Field(ReviewFocus.GENERAL, description="Primary focus area")
-    include_patterns: List[str] = Field(default_factory=list, description="File patterns to include")
-    exclude_patterns: List[str] = Field(default_factory=list, description="File patterns to exclude")
+    include_patterns: Tuple[str, ...] = Field((), description="File patterns to include")
+    exclude_patterns: Tuple[str, ...] = Field((), description="File patterns to exclude")
     max_files: int = Field(50, description="Maximum number of files to review")
     
     # AI parameters
@@ -57,28 +78,57 @@ class ReviewRequest(BaseModel):
     # Additional context
     context: Optional[str] = Field(None, description="Additional context for the review")
     custom_prompt: Optional[str] = Field(None, description="Custom prompt to use")
+    
+    @property
+    def ai_params(self) -> "AIParams":
+        """Get the AI settings of this request as a hashable AIParams."""
+        return AIParams.model_construct(
+            **{name: getattr(self, name) for name in AIParams.model_fields}
+        )
+    
+    @property
+    def ai_cache_key(self) -> str:
+        """Get a stable key for caching AI calls made with these settings."""
+        return hashlib.sha256(self.ai_params.model_dump_json().encode()).hexdigest()
+
+
+def _utcnow() -> datetime:
+    """Get the current UTC time as a naive datetime, like datetime.utcnow()."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
-class ReviewMetrics(BaseModel):
+@dataclass(**DATACLASS_SLOTS)
+class ReviewMetrics:
     """Metrics and statistics from a code review."""
     
     # Issue counts by severity
-    critical_issues: int = Field(default=0, description="Number of critical issues")
-    high_issues: int = Field(default=0, description="Number of high severity issues")
-    medium_issues: int = Field(default=0, description="Number of medium severity issues")
-    low_issues: int = Field(default=0, description="Number of low severity issues")
-    info_issues: int = Field(default=0, description="Number of info-level issues")
+    critical_issues: int = 0  # Number of critical issues
+    high_issues: int = 0  # Number of high severity issues
+    medium_issues: int = 0  # Number of medium severity issues
+    low_issues: int = 0  # Number of low severity issues
+    info_issues: int = 0  # Number of info-level issues
     
     # File statistics
-    files_reviewed: int = Field(default=0, description="Number of files reviewed")
-    lines_added: int = Field(default=0, description="Total lines added")
-    lines_deleted: int = Field(default=0, description="Total lines deleted")
+    files_reviewed: int = 0  # Number of files reviewed
+    lines_added: int = 0  # Total lines added
+    lines_deleted: int = 0  # Total lines deleted
     
     # Performance metrics
-    review_duration: Optional[float] = Field(None, description="Review duration in seconds")
-    ai_api_calls: int = Field(default=0, description="Number of AI API calls made")
-    tokens_used: Optional[int] = Field(None, description="Total tokens used")
-    cost_estimate: Optional[float] = Field(None, description="Estimated cost in USD")
+    review_duration: Optional[float] = None  # Review duration in seconds
+    ai_api_calls: int = 0  # Number of AI API calls made
+    tokens_used: Optional[int] = None  # Total tokens used
+    cost_estimate: Optional[float] = None  # Estimated cost in USD
+    
+    # Memoized calculate_score() result, cleared whenever a field changes
+    _score: Annotated[Optional[float], Field(exclude=True)] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field, clearing the cached score if a metric changed."""
+        object.__setattr__(self, name, value)
+        if name != "_score":
+            object.__setattr__(self, "_score", None)
     
     @property
     def total_issues(self) -> int:
@@ -100,26 +150,133 @@ class ReviewMetrics(BaseModel):
     
     def calculate_score(self) -> float:
         """Calculate a review score (0-100) based on issues found."""
-        if self.total_issues == 0:
-            return 100.0
-        
-        # Weight issues by severity
-        weighted_issues = (
+        if self._score is None:
+            self._score = self._compute_score()
+        return self._score
+    
+    def _compute_score(self) -> float:
+        """Compute the review score from the current issue counts."""
+        info_issues = self.info_issues
+        weighted_int = (
             self.critical_issues * 10 +
             self.high_issues * 5 +
             self.medium_issues * 2 +
-            self.low_issues * 1 +
-            self.info_issues * 0.5
+            self.low_issues
         )
+        if weighted_int == 0 and info_issues == 0:
+            return 100.0
+        
+        # Weight issues by severity, staying in integers until the info term
+        weighted_issues = weighted_int + info_issues * 0.5
         
         # Calculate score relative to lines of code
-        if self.total_changes == 0:
+        total_changes = self.lines_added + self.lines_deleted
+        if total_changes == 0:
             return max(0, 100 - weighted_issues)
         
-        issue_density = weighted_issues / self.total_changes * 100
+        issue_density = weighted_issues / total_changes * 100
         return max(0, 100 - issue_density)
 
 
+def _int_column() -> array:
+    """Create an empty signed 64-bit integer column."""
+    return array("q")
+
+
+@dataclass(**DATACLASS_SLOTS)
+class ReviewMetricsTable:
+    """
+    Column-oriented metrics for many reviews.
+    
+    Each metric is stored in its own contiguous integer array, so totals
+    across a history of reviews are a single sum() over one buffer instead
+    of an attribute lookup per review.
+    """
+    
+    critical: array = field(default_factory=_int_column)
+    high: array = field(default_factory=_int_column)
+    medium: array = field(default_factory=_int_column)
+    low: array = field(default_factory=_int_column)
+    info: array = field(default_factory=_int_column)
+    files_reviewed: array = field(default_factory=_int_column)
+    lines_added: array = field(default_factory=_int_column)
+    lines_deleted: array = field(default_factory=_int_column)
+    
+    @classmethod
+    def from_metrics(cls, metrics: Iterable[ReviewMetrics]) -> "ReviewMetricsTable":
+        """
+        Build a table from review metrics.
+        
+        Args:
+            metrics: Metrics to add, one row per review
+            
+        Returns:
+            ReviewMetricsTable holding the metrics
+        """
+        table = cls()
+        for item in metrics:
+            table.append(item)
+        return table
+    
+    @classmethod
+    def from_reviews(cls, reviews: Iterable["ReviewResult"]) -> "ReviewMetricsTable":
+        """
+        Build a table from the metrics of review results.
+        
+        Args:
+            reviews: Review results to add, one row per review
+            
+        Returns:
+            ReviewMetricsTable holding the review metrics
+        """
+        return cls.from_metrics(review.metrics for review in reviews)
+    
+    def append(self, metrics: ReviewMetrics) -> None:
+        """Add one review's metrics as a new row."""
+        self.critical.append(metrics.critical_issues)
+        self.high.append(metrics.high_issues)
+        self.medium.append(metrics.medium_issues)
+        self.low.append(metrics.low_issues)
+        self.info.append(metrics.info_issues)
+        self.files_reviewed.append(metrics.files_reviewed)
+        self.lines_added.append(metrics.lines_added)
+        self.lines_deleted.append(metrics.lines_deleted)
+    
+    def __len__(self) -> int:
+        """Get the number of reviews in the table."""
+        return len(self.critical)
+    
+    def total_issues_sum(self) -> int:
+        """Get the total number of issues across all reviews."""
+        return (
+            sum(self.critical) + sum(self.high) + sum(self.medium) +
+            sum(self.low) + sum(self.info)
+        )
+    
+    def blocking_issues_sum(self) -> int:
+        """Get the total number of blocking issues across all reviews."""
+        return sum(self.critical) + sum(self.high)
+    
+    def total_changes_sum(self) -> int:
+        """Get the total number of line changes across all reviews."""
+        return sum(self.lines_added) + sum(self.lines_deleted)
+
+
+class ReviewSummary(NamedTuple):
+    """Read-only summary of a review result for display."""
+    
+    id: str
+    status: str
+    total_issues: int
+    blocking_issues: int
+    files_reviewed: int
+    score: float
+    approved: bool
+    created_at: str
+    created_at_ts: float
+    duration: Optional[float]
+
+
 class ReviewResult(BaseModel):
     """Result of a code review operation."""
     
@@ -134,13 +291,13 @@ class ReviewResult(BaseModel):
     diff: Optional[GitDiff] = Field(None, description="Git diff that was reviewed")
     issues: List[Issue] = Field(default_factory=list, description="Issues found during review")
     summary: Optional[str] = Field(None, description="Overall review summary")
-    recommendations: List[str] = Field(default_factory=list, description="General recommendations")
+    recommendations: Tuple[str, ...] = Field((), description="General recommendations")
     
     # Metrics
     metrics: ReviewMetrics = Field(default_factory=ReviewMetrics, description="Review metrics")
     
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="When review was created")
+    created_at: datetime = Field(default_factory=_utcnow, description="When review was created")
     started_at: Optional[datetime] = Field(None, description="When review started")
     completed_at: Optional[datetime] = Field(None, description="When review completed")
     
@@ -151,12 +308,89 @@ class ReviewResult(BaseModel):
     # Error information
     error_message: Optional[str] = Field(None, description="Error message if review failed")
     
+    # created_at and its ISO string, recomputed if created_at is reassigned
+    _created_at_iso: Optional[Tuple[datetime, str]] = PrivateAttr(default=None)
+    _created_at_ts: Optional[Tuple[datetime, float]] = PrivateAttr(default=None)
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare field values only, ignoring the cached created_at forms."""
+        if not isinstance(other, ReviewResult):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+    
+    @classmethod
+    def from_trusted(cls, **fields: Any) -> "ReviewResult":
+        """
+        Build a result from already-validated values, skipping validation.
+        
+        Only pass values this application built itself (ReviewRequest,
+        GitDiff, Issue and ReviewMetrics instances). Raw dicts from JSON,
+        the cache or other external sources must go through model_validate.
+        
+        Args:
+            **fields: Field values for the result
+            
+        Returns:
+            ReviewResult built without validation
+        """
+        return cls.model_construct(**fields)
+    
+    @classmethod
+    def dump_many(cls, results: List["ReviewResult"]) -> List[Dict[str, Any]]:
+        """
+        Serialize a list of results to JSON-compatible dictionaries.
+        
+        Args:
+            results: Review results to serialize
+            
+        Returns:
+            List of serialized results
+        """
+        return _review_list_adapter().dump_python(results, mode="json")
+    
+    @classmethod
+    def load_many(cls, data: List[Dict[str, Any]]) -> List["ReviewResult"]:
+        """
+        Validate a list of serialized results.
+        
+        Args:
+            data: Serialized review results
+            
+        Returns:
+            List of ReviewResult instances
+        """
+        return _review_list_adapter().validate_python(data)
+    
+    @classmethod
+    def dump_many_json(cls, results: List["ReviewResult"]) -> bytes:
+        """
+        Serialize a list of results directly to a JSON array.
+        
+        Args:
+            results: Review results to serialize
+            
+        Returns:
+            JSON-encoded results
+        """
+        return _review_list_adapter().dump_json(results)
+    
+    @classmethod
+    def load_many_json(cls, raw: Union[str, bytes]) -> List["ReviewResult"]:
+        """
+        Validate a JSON array of results without building dicts first.
+        
+        Args:
+            raw: JSON-encoded review results
+            
+        Returns:
+            List of ReviewResult instances
+        """
+        return _review_list_adapter().validate_json(raw)
+    
     def calculate_metrics(self) -> None:
         """Calculate metrics from issues and diff."""
         # Count issues by severity
-        severity_counts = {}
-        for issue in self.issues:
-            severity_counts[issue.severity] = severity_counts.get(issue.severity, 0) + 1
+        severity_counts = Counter(map(attrgetter("severity"), self.issues))
         
         self.metrics.critical_issues = severity_counts.get(IssueSeverity.CRITICAL, 0)
         self.metrics.high_issues = severity_counts.get(IssueSeverity.HIGH, 0)
@@ -181,28 +415,59 @@ class ReviewResult(BaseModel):
     
     def get_blocking_issues(self) -> List[Issue]:
         """Get all blocking issues (critical and high severity)."""
-        return [
-            issue for issue in self.issues 
-            if issue.severity in [IssueSeverity.CRITICAL, IssueSeverity.HIGH]
-        ]
+        return [issue for issue in self.issues if issue.severity in BLOCKING_SEVERITIES]
     
     def is_approved(self) -> bool:
         """Check if the review should be approved (no blocking issues)."""
-        return len(self.get_blocking_issues()) == 0
+        # Stop at the first blocker instead of building the blocking list
+        return not any(issue.is_blocking() for issue in self.issues)
+    
+    def _get_created_at_iso(self) -> str:
+        """Get created_at as an ISO string, formatting it only once."""
+        cached = self._created_at_iso
+        if cached is None or cached[0] is not self.created_at:
+            cached = (self.created_at, self.created_at.isoformat())
+            self._created_at_iso = cached
+        return cached[1]
+    
+    @property
+    def created_at_ts(self) -> float:
+        """Get created_at as a POSIX timestamp, for sorting without parsing."""
+        cached = self._created_at_ts
+        if cached is None or cached[0] is not self.created_at:
+            created_at = self.created_at
+            if created_at.tzinfo is None:
+                # Naive timestamps are stored in UTC
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            cached = (self.created_at, created_at.timestamp())
+            self._created_at_ts = cached
+        return cached[1]
+    
+    def to_summary(self) -> ReviewSummary:
+        """Convert to a summary tuple for display."""
+        metrics = self.metrics
+        return ReviewSummary(
+            id=self.id,
+            status=self.status.value,
+            total_issues=metrics.total_issues,
+            blocking_issues=metrics.blocking_issues,
+            files_reviewed=metrics.files_reviewed,
+            score=metrics.calculate_score(),
+            approved=self.is_approved(),
+            created_at=self._get_created_at_iso(),
+            created_at_ts=self.created_at_ts,
+            duration=metrics.review_duration,
+        )
     
     def to_summary_dict(self) -> Dict[str, Any]:
         """Convert to a summary dictionary for display."""
-        return {
-            "id": self.id,
-            "status": self.status.value,
-            "total_issues": self.metrics.total_issues,
-            "blocking_issues": self.metrics.blocking_issues,
-            "files_reviewed": self.metrics.files_reviewed,
-            "score": self.metrics.calculate_score(),
-            "approved": self.is_approved(),
-            "created_at": self.created_at.isoformat(),
-            "duration": self.metrics.review_duration,
-        }
+        return self.to_summary()._asdict()
+
+
+@functools.lru_cache(maxsize=1)
+def _review_list_adapter() -> TypeAdapter:
+    """Build the list-of-results adapter on first use and reuse it."""
+    return TypeAdapter(List[ReviewResult])
 
 
 class Review(BaseModel):
@@ -211,6 +476,16 @@ class Review(BaseModel):
     request: ReviewRequest = Field(..., description="Review request")
     result: Optional[ReviewResult] = Field(None, description="Review result (if completed)")
     
+    def finalize(self, result: ReviewResult) -> None:
+        """
+        Attach a finished result, calculating its metrics.
+        
+        Args:
+            result: Result of the review
+        """
+        result.calculate_metrics()
+        self.result = result
+    
     @property
     def is_completed(self) -> bool:
         """Check if the review is completed."""